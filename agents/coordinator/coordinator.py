@@ -1,13 +1,15 @@
 import os
 import sys
-import json
 
-# Add the project root (2 levels up from this file) to Python's module search path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+# Add the project root (2 levels up from this file) to Python's module search path,
+# unless another agent module already did
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 # Import Utility functions
 from utils import setup_logger
-from utils import load_instructions_file
+from utils import load_instructions_file, load_json_cached
 
 # Import necessary modules from Google ADK
 from google.adk import Agent
@@ -25,6 +27,22 @@ logger = setup_logger(__name__)
 # Mocking Student ID
 STUDENT_ID = "862547410"
 
+# Student fields copied into session state; everything else in a record stays out of state
+_STUDENT_STATE_FIELDS = ("name", "student_id", "graduation_quarter", "graduation_year", "courses_taken")
+
+def _index_students(students: list[dict]) -> dict[str, dict]:
+    index = {}
+    for s in students:
+        student_id = s.get("student_id")
+        # The first record for an ID wins, as it did with the old linear scan
+        if student_id is not None and student_id not in index:
+            index[student_id] = {k: s[k] for k in _STUDENT_STATE_FIELDS if k in s}
+    return index
+
+# Indexing the student database by student ID; re-parsed only when students.json changes
+def _load_students(path: str = "database/students.json") -> dict[str, dict]:
+    return load_json_cached(path, _index_students)
+
 # === Agent Configuration ===
 MODEL = "gemini-2.0-flash"
 NAME = "manager"
@@ -32,34 +50,32 @@ INSTRUCTIONS = load_instructions_file(filename="agents/coordinator/instructions.
 DESCRIPTION = load_instructions_file(filename="agents/coordinator/description.txt")
 
 # === Logging Configuration ===
-logger.info(f"Entered {NAME} agent.")
-logger.info(f"Using Description: {DESCRIPTION[:50]}...")  # Log first 50 characters for brevity
-logger.info(f"Using Instructions: {INSTRUCTIONS[:50]}...")  # Log first 50 characters for brevity
+logger.info("Entered %s agent.", NAME)
+logger.info("Using Description: %.50s...", DESCRIPTION)  # Log first 50 characters for brevity
+logger.info("Using Instructions: %.50s...", INSTRUCTIONS)  # Log first 50 characters for brevity
 
 # === Agent Callbacks ===
 def before_agent_callback(callback_context: CallbackContext) -> Optional[types.Content]:
     """
     Callback that runs before the agent starts processing a request.
 
-    Loads the student record matching STUDENT_ID from students.json
-    and sets it into context state as 'student_details'.
+    Looks up the student record matching STUDENT_ID in the cached students.json
+    index and sets it into context state as 'student_details'.
     """
     state = callback_context.state
 
     try:
-        with open("database/students.json", "r") as f:
-            students = json.load(f)
-        student = next((s for s in students if s["student_id"] == STUDENT_ID), None)
+        student = _load_students().get(STUDENT_ID)
 
         if student:
             state["student_details"] = student
-            logger.info(f"[BEFORE CALLBACK] Loaded student: {student['name']} ({STUDENT_ID})")
+            logger.info("[BEFORE CALLBACK] Loaded student: %s (%s)", student.get("name"), STUDENT_ID)
         else:
-            logger.warning(f"[BEFORE CALLBACK] Student ID {STUDENT_ID} not found in students.json")
+            logger.warning("[BEFORE CALLBACK] Student ID %s not found in students.json", STUDENT_ID)
             state["student_details"] = {}
 
     except Exception as e:
-        logger.error(f"[BEFORE CALLBACK] Failed to load students.json: {e}")
+        logger.error("[BEFORE CALLBACK] Failed to load students.json: %s", e)
         state["student_details"] = {}
 
     logger.info("[BEFORE CALLBACK] Initialized state with student details and metadata.")
@@ -79,4 +95,4 @@ coordinator = Agent(
 root_agent = coordinator
 
 # Log the successful initialization of the agent
-logger.info(f"Initialized {NAME} agent.")
\ No newline at end of file
+logger.info("Initialized %s agent.", NAME)
\ No newline at end of file
@@ -1,35 +1,124 @@
 import os
 import sys
 import json
+import logging
+from operator import itemgetter
+from dataclasses import dataclass
 from pathlib import Path
 
-# Add the project root (2 levels up from this file) to Python's module search path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+# Add the project root (2 levels up from this file) to Python's module search path,
+# unless another agent module already did
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext
-from utils import load_instructions_file, setup_logger
+from utils import load_instructions_file, load_json_cached, setup_logger
 
 # === Logging Setup ===
 logger = setup_logger(__name__)
 
-# Loading different database files and caching them 
-_COURSE_CACHE = None
-_OFFERINGS_CACHE = None
+# Loading different database files and caching them.
+# Each file is cached separately by load_json_cached and re-parsed only when its own modification time changes.
+@dataclass(frozen=True)
+class CourseCatalog:
+    """
+    Parsed courses.json together with the indexes the tools look up.
+
+    Attributes:
+        courses (list[dict]): Course catalog, sorted by course_id.
+        by_id (dict): course_id -> course dict.
+        prereqs_by_id (dict): course_id -> frozenset of prerequisite course IDs. Kept apart from
+            the course dicts, which are returned to the model as-is.
+    """
+    courses: list[dict]
+    by_id: dict[str, dict]
+    prereqs_by_id: dict[str, frozenset[str]]
+
+@dataclass(frozen=True)
+class OfferingsIndex:
+    """
+    Parsed offerings.json indexed by term.
+
+    Attributes:
+        by_term (dict): (lowercased term, year) -> offerings entry, whose "courses"
+            are a de-duplicated, sorted tuple.
+    """
+    by_term: dict[tuple[str, int], dict]
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """The current course catalog and offerings, each cached separately by file."""
+    courses: CourseCatalog
+    offerings: OfferingsIndex
+
+def _build_courses(records: list[dict]) -> CourseCatalog:
+    # Records without a course_id can never be looked up, so leave them out of the indexes
+    courses = [c for c in records if isinstance(c.get("course_id"), str)]
+    if len(courses) != len(records):
+        logger.warning("Skipped %d course record(s) without a course_id", len(records) - len(courses))
+
+    # Keep the catalog in course_id order so filtered views come out sorted.
+    # The sort is stable, so records sharing a course_id keep their file order.
+    courses.sort(key=itemgetter("course_id"))
+
+    # The first record for a course_id wins, as it did with the old linear scan
+    by_id = {}
+    for c in courses:
+        by_id.setdefault(c["course_id"], c)
+
+    return CourseCatalog(
+        courses=courses,
+        by_id=by_id,
+        prereqs_by_id={cid: frozenset(c.get("prerequisites", ())) for cid, c in by_id.items()},
+    )
 
-def _load_courses(path: str | Path = "database/courses.json") -> list[dict]:
-    global _COURSE_CACHE
-    if _COURSE_CACHE is None:
-        with open(path, "r", encoding="utf-8") as f:
-            _COURSE_CACHE = json.load(f)
-    return _COURSE_CACHE
+def _build_offerings(offerings: list[dict]) -> OfferingsIndex:
+    by_term = {}
+    for entry in offerings:
+        try:
+            key = (entry["term"].lower(), int(entry["year"]))
+        except (KeyError, AttributeError, TypeError, ValueError):
+            logger.warning("Skipped offerings entry without a valid term/year: %s", entry)
+            continue
+
+        # The first entry for a term wins, as it did with the old linear scan
+        if key in by_term:
+            continue
+
+        # Sort (and de-duplicate) each term's course list once here rather than on every lookup
+        # Stored as a tuple so callers cannot change the cached list in place
+        entry["courses"] = tuple(sorted({c for c in entry.get("courses", []) if isinstance(c, str)}))
+        by_term[key] = entry
+    return OfferingsIndex(by_term=by_term)
+
+def _load_courses(path: str | Path = "database/courses.json") -> CourseCatalog:
+    """Returns the cached CourseCatalog, re-parsing courses.json if it changed on disk."""
+    return load_json_cached(path, _build_courses)
+
+def _load_offerings(path: str | Path = "database/offerings.json") -> OfferingsIndex:
+    """Returns the cached OfferingsIndex, re-parsing offerings.json if it changed on disk."""
+    return load_json_cached(path, _build_offerings)
+
+def get_catalog_snapshot(
+    courses_path: str | Path = "database/courses.json",
+    offerings_path: str | Path = "database/offerings.json",
+) -> CatalogSnapshot:
+    """
+    Returns the current courses and offerings, each from its own file cache.
 
-def _load_offerings(path: str | Path = "database/offerings.json") -> list[dict]:
-    global _OFFERINGS_CACHE
-    if _OFFERINGS_CACHE is None:
-        with open(path, "r", encoding="utf-8") as f:
-            _OFFERINGS_CACHE = json.load(f)
-    return _OFFERINGS_CACHE
+    Tools that only need one file should use `_load_courses` or `_load_offerings`
+    directly, so a problem with the other file does not affect them.
+
+    Raises:
+        FileNotFoundError: If either file is missing.
+        json.JSONDecodeError: If either file is not valid JSON.
+    """
+    return CatalogSnapshot(
+        courses=_load_courses(courses_path),
+        offerings=_load_offerings(offerings_path),
+    )
 
 
 # === Tools ===
@@ -60,11 +149,10 @@ def get_enrollable_courses(quarter: str, year: str, tool_context: ToolContext) -
         taken = set(student.get("courses_taken", []))
         year_int = int(year)
 
-        catalog = _load_courses()
-        offerings = _load_offerings()
+        snap = get_catalog_snapshot()
 
     except (KeyError, FileNotFoundError, json.JSONDecodeError, ValueError) as e:
-        logger.error(f"Failed to load data: {e}")
+        logger.error("Failed to load data: %s", e)
         return {
             "status": "error",
             "message": f"Failed to compute enrollable courses: {e}",
@@ -72,10 +160,7 @@ def get_enrollable_courses(quarter: str, year: str, tool_context: ToolContext) -
         }
 
     # Find offered course IDs for this quarter/year
-    offering_this_term = next(
-        (entry for entry in offerings if entry["term"].lower() == quarter.lower() and entry["year"] == year_int),
-        None
-    )
+    offering_this_term = snap.offerings.by_term.get((quarter.lower(), year_int))
 
     if not offering_this_term:
         msg = f"No offerings found for {quarter} {year}"
@@ -86,25 +171,24 @@ def get_enrollable_courses(quarter: str, year: str, tool_context: ToolContext) -
             "courses": []
         }
 
-    offered_courses = set(offering_this_term["courses"])
-    logger.info(f"Courses offered in {quarter} {year}: {offered_courses}")
-
-    enrollable = []
-    for course in catalog:
-        course_id = course.get("course_id")
-        prereqs = set(course.get("prerequisites", []))
-
-        if (
-            course_id in offered_courses and
-            course_id not in taken and
-            prereqs.issubset(taken)
-        ):
-            enrollable.append(course)
-
-    enrollable = sorted(enrollable, key=lambda c: c["course_id"])
-
-    logger.info(f"Student's courses taken: {taken}")
-    logger.info(f"Eligible courses for enrollment: {[c['course_id'] for c in enrollable]}")
+    offered_courses = offering_this_term["courses"]
+    catalog = snap.courses
+    logger.info("Courses offered in %s %s: %s", quarter, year, offered_courses)
+
+    # Walk the term's offered IDs (already sorted) and look each one up in the
+    # catalog, instead of scanning the whole catalog for offered courses
+    enrollable = [
+        catalog.by_id[course_id]
+        for course_id in offered_courses
+        if course_id not in taken
+        and course_id in catalog.by_id
+        and catalog.prereqs_by_id[course_id] <= taken
+    ]
+
+    logger.info("Student's courses taken: %s", taken)
+    # Only build the list of eligible IDs when it will actually be logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Eligible courses for enrollment: %s", [c["course_id"] for c in enrollable])
 
     return {
         "status": "success",
@@ -148,7 +232,7 @@ def get_course_details(course_id: str) -> dict:
     """
 
     try:
-        courses = _load_courses()
+        catalog = _load_courses()
     except (FileNotFoundError, json.JSONDecodeError) as exc:
         return {
             "status": "error",
@@ -156,13 +240,13 @@ def get_course_details(course_id: str) -> dict:
             "message": f"Unable to load course catalog: {exc}"
         }
 
-    # Find the first course whose course_id matches (case-sensitive)
-    for course in courses:
-        if course.get("course_id") == course_id:
-            return {
-                "status": "success",
-                "course_details": course
-            }
+    # Look up the course by its course_id (case-sensitive)
+    course = catalog.by_id.get(course_id)
+    if course is not None:
+        return {
+            "status": "success",
+            "course_details": course
+        }
 
     # If nothing matched
     return {
@@ -194,9 +278,9 @@ def get_course_offerings(quarter: str, year: str) -> dict:
     """
     try:
         year_int = int(year)
-        offerings_data = _load_offerings()
+        offerings = _load_offerings()
     except (ValueError, FileNotFoundError, json.JSONDecodeError) as exc:
-        logger.error(f"Unable to load offerings data: {exc}")
+        logger.error("Unable to load offerings data: %s", exc)
         return {
             "status": "error",
             "message": f"Failed to retrieve offerings: {exc}",
@@ -204,13 +288,7 @@ def get_course_offerings(quarter: str, year: str) -> dict:
         }
 
     # Locate the term entry
-    term_entry = next(
-        (
-            entry for entry in offerings_data
-            if entry["term"].lower() == quarter.lower() and entry["year"] == year_int
-        ),
-        None
-    )
+    term_entry = offerings.by_term.get((quarter.lower(), year_int))
 
     if term_entry is None:
         msg = f"No offerings found for {quarter} {year}."
@@ -221,8 +299,8 @@ def get_course_offerings(quarter: str, year: str) -> dict:
             "offerings": []
         }
 
-    courses = sorted(term_entry.get("courses", []))
-    logger.info(f"Offerings for {quarter} {year}: {courses}")
+    courses = list(term_entry["courses"])
+    logger.info("Offerings for %s %s: %s", quarter, year, courses)
 
     return {
         "status": "success",
@@ -230,6 +308,10 @@ def get_course_offerings(quarter: str, year: str) -> dict:
         "offerings": courses
     }
 
+# Schedulable weekdays, and one bit per weekday for building avoid_days masks
+_ALL_DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+_DAY_BITS = {day.lower(): 1 << i for i, day in enumerate(_ALL_DAYS)}
+
 def build_schedule(avoid_days: list[str], avoid_times: list[str], tool_context: ToolContext) -> str:
     """
     Builds a mock student schedule based on the provided constraints.
@@ -244,10 +326,11 @@ def build_schedule(avoid_days: list[str], avoid_times: list[str], tool_context:
     Returns:
         str: A confirmation message indicating that the schedule was built using the given constraints.
     """
-    all_days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-    avoid_set = set(day.capitalize() for day in avoid_days)
+    avoid_mask = 0
+    for day in avoid_days:
+        avoid_mask |= _DAY_BITS.get(day.lower(), 0)
 
-    allowed_days = [day for day in all_days if day not in avoid_set]
+    allowed_days = [day for i, day in enumerate(_ALL_DAYS) if not (avoid_mask >> i) & 1]
 
     tool_context.state["constraints"] = {
         "allowed_days": allowed_days,
@@ -288,9 +371,9 @@ DESCRIPTION = load_instructions_file("agents/scheduler/description.txt")
 INSTRUCTIONS = load_instructions_file("agents/scheduler/instructions.txt")
 
 # === Logging ===
-logger.info(f"Entered {NAME} agent.")
-logger.info(f"Using Description: {DESCRIPTION[:50]}...")
-logger.info(f"Using Instructions: {INSTRUCTIONS[:50]}...")
+logger.info("Entered %s agent.", NAME)
+logger.info("Using Description: %.50s...", DESCRIPTION)
+logger.info("Using Instructions: %.50s...", INSTRUCTIONS)
 
 # === Instantiate Agent ===
 scheduler = Agent(
@@ -302,4 +385,4 @@ scheduler = Agent(
 )
 
 root_agent = scheduler
-logger.info(f"Initialized {NAME} agent.")
\ No newline at end of file
+logger.info("Initialized %s agent.", NAME)
\ No newline at end of file
@@ -1,8 +1,11 @@
 import os
 import sys
 
-# Add the project root (2 levels up from this file) to Python's module search path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+# Add the project root (2 levels up from this file) to Python's module search path,
+# unless another agent module already did
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from google.adk.agents import Agent
 from utils import load_instructions_file, setup_logger
@@ -17,9 +20,9 @@ DESCRIPTION = load_instructions_file(filename="agents/talkative/description.txt"
 INSTRUCTIONS = load_instructions_file(filename="agents/talkative/instructions.txt")
 
 # === Logging ===
-logger.info(f"Entered {NAME} agent.")
-logger.info(f"Using Description: {DESCRIPTION[:50]}...")
-logger.info(f"Using Instructions: {INSTRUCTIONS[:50]}...")
+logger.info("Entered %s agent.", NAME)
+logger.info("Using Description: %.50s...", DESCRIPTION)
+logger.info("Using Instructions: %.50s...", INSTRUCTIONS)
 
 # Create the agent
 talkative = Agent(
@@ -30,4 +33,4 @@ talkative = Agent(
 )
 
 root_agent = talkative
-logger.info(f"Initialized {NAME} agent.")
\ No newline at end of file
+logger.info("Initialized %s agent.", NAME)
\ No newline at end of file
@@ -1,2 +1,2 @@
-from utils.file_loader import load_instructions_file
+from utils.file_loader import load_instructions_file, load_json_cached
 from utils.logging_config import setup_logger
\ No newline at end of file
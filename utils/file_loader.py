@@ -1,9 +1,18 @@
+import json
 import os
+import threading
+from typing import Any, Callable, TypeVar
+
+# Contents of successfully read files, keyed by filename. Failed reads are not
+# stored, so a file that is missing at first load is retried on the next call.
+_FILE_CONTENTS: dict[str, str] = {}
 
 def load_instructions_file(filename: str, default: str = "") -> str:
     """
     Loads instruction or description text from a given file path.
 
+    Successful reads are memoized per filename, since instruction files do not change at runtime.
+
     Args:
         filename (str): Path to the file to read (relative or absolute).
         default (str): Default string to return if the file is not found or fails to load.
@@ -12,9 +21,14 @@ def load_instructions_file(filename: str, default: str = "") -> str:
         str: The file contents if successful, or the fallback default string.
     """
 
+    if filename in _FILE_CONTENTS:
+        return _FILE_CONTENTS[filename]
+
     try:
         with open(filename, "r", encoding="utf-8") as f:
-            return f.read()
+            contents = f.read()
+        _FILE_CONTENTS[filename] = contents
+        return contents
 
     except FileNotFoundError:
         # If the file doesn't exist, log a warning and fall back to the default value.
@@ -25,4 +39,40 @@ def load_instructions_file(filename: str, default: str = "") -> str:
         print(f"[ERROR] Failed to load {filename}: {e}")
 
     # Return the fallback default string if anything goes wrong.
-    return default
\ No newline at end of file
+    return default
+
+# Parsed JSON files keyed by path: path -> (st_mtime_ns, built data). A file is
+# re-parsed only when its modification time changes; failed loads raise and
+# are not stored, so the next call retries. The lock makes concurrent callers
+# that see a stale entry parse the file only once.
+_JSON_CACHE: dict[str, tuple[int, Any]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+T = TypeVar("T")
+
+def load_json_cached(path: str | os.PathLike, build: Callable[[Any], T]) -> T:
+    """
+    Loads a JSON file and caches the result of `build` on its contents until the file changes.
+
+    Args:
+        path (str | PathLike): Path to the JSON file (relative or absolute).
+        build (Callable): Turns the parsed JSON into the value to cache (e.g. an index).
+
+    Returns:
+        The cached `build` result for the file's current modification time.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    key = os.fspath(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+    cached = _JSON_CACHE.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with _JSON_CACHE_LOCK:
+            cached = _JSON_CACHE.get(key)
+            if cached is None or cached[0] != mtime_ns:
+                with open(key, "r", encoding="utf-8") as f:
+                    cached = (mtime_ns, build(json.load(f)))
+                _JSON_CACHE[key] = cached
+    return cached[1]
@@ -1,29 +1,55 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 
-def setup_logger(name: str) -> logging.Logger:
-    os.makedirs("logs", exist_ok=True)
+# Every logger hands its records to this queue; a single listener thread
+# writes them to the shared log file and the console, so logging calls
+# return after a queue put instead of a disk write.
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
+
+def _start_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+
+        os.makedirs("logs", exist_ok=True)
+
+        # Format: 11 July 2025 - 11-02 PM
+        timestamp = datetime.now().strftime("%d %B %Y - %I-%M %p")
+        log_filename = f"logs/{timestamp}.log"
 
-    # Format: 11 July 2025 - 11-02 PM
-    timestamp = datetime.now().strftime("%d %B %Y - %I-%M %p")
-    log_filename = f"logs/{timestamp}.log"
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+        # delay=True opens the file on the first record rather than here
+        file_handler = logging.FileHandler(log_filename, delay=True)
+        file_handler.setFormatter(formatter)
 
-    file_handler = logging.FileHandler(log_filename)
-    file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
 
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
+        _listener = logging.handlers.QueueListener(_log_queue, file_handler, stream_handler)
+        _listener.start()
+
+        # Flush queued records on interpreter shutdown
+        atexit.register(_listener.stop)
+
+def setup_logger(name: str) -> logging.Logger:
+    if _listener is None:
+        _start_listener()
 
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
     # Prevent duplicate handlers if already set
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(stream_handler)
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
         logger.propagate = False
 
     return logger